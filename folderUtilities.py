@@ -1,7 +1,377 @@
 import os
+import re
+import asyncio
+import stat
+import errno
 import shutil
+import fnmatch
 import platform
+import tempfile
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
+
+
+def _scan_dir(path):
+    """Yield os.DirEntry untuk setiap isi folder (satu level)."""
+    with os.scandir(path) as it:
+        yield from it
+
+
+def _list_dir(root, stat_files=False, prune=None):
+    """
+    Baca satu folder -> (root, dirs, files) berisi os.DirEntry, None jika gagal dibaca.
+
+    stat_files=True -> stat file langsung saat listing; hasilnya di-cache di
+    DirEntry sehingga pemanggil bisa memakai entry.stat() tanpa syscall lagi.
+    prune(name) True -> subfolder dibuang dari `dirs` (dan tidak ditelusuri).
+    """
+    dirs, files = [], []
+    try:
+        for entry in _scan_dir(root):
+            try:
+                if entry.is_dir():
+                    if prune is None or not prune(entry.name):
+                        dirs.append(entry)
+                    continue
+                if stat_files and entry.is_file():
+                    entry.stat()
+            except OSError:
+                pass
+            files.append(entry)
+    except OSError:
+        return None
+    return root, dirs, files
+
+
+def _subdirs(dirs, depth=0, max_depth=None):
+    """Path subfolder yang ditelusuri (symlink ke folder tidak diikuti, batas max_depth)."""
+    if max_depth is not None and depth >= max_depth:
+        return []
+    return [d.path for d in dirs if d.is_dir(follow_symlinks=False)]
+
+
+# paralel hanya dipakai jika level teratas punya minimal sekian subfolder
+_PARALLEL_MIN_DIRS = 4
+
+
+def _walk(path, workers=None, stat_files=False, prune=None, max_depth=None):
+    """
+    Walker rekursif berbasis stack di atas os.scandir (top-down, seperti os.walk).
+
+    Yield tuple (root, dirs, files) berisi list os.DirEntry. Symlink ke folder
+    tetap masuk `dirs` tapi tidak ditelusuri; folder yang gagal dibaca dilewati.
+    workers > 1 -> scandir tiap subfolder dijalankan di thread pool, urutan
+    hasil tetap sama dengan mode sequential. stat_files & prune diteruskan ke
+    _list_dir; max_depth membatasi kedalaman (0 -> hanya folder `path`).
+    """
+    top = _list_dir(path, stat_files, prune)
+    if top is None:
+        return
+    subdirs = _subdirs(top[1], 0, max_depth)
+    if workers and workers > 1 and len(subdirs) >= _PARALLEL_MIN_DIRS:
+        yield from _walk_parallel(top, subdirs, workers, stat_files, prune, max_depth)
+        return
+
+    yield top
+    # dibalik supaya urutan pop sama dengan urutan os.walk
+    stack = [(d, 1) for d in reversed(subdirs)]
+    while stack:
+        root, depth = stack.pop()
+        step = _list_dir(root, stat_files, prune)
+        if step is None:
+            continue
+        yield step
+        stack.extend((d, depth + 1) for d in reversed(_subdirs(step[1], depth, max_depth)))
+
+
+def _walk_parallel(top, subdirs, workers, stat_files=False, prune=None, max_depth=None):
+    """Versi thread pool dari _walk; tiap worker men-submit subfoldernya sendiri."""
+    pool = ThreadPoolExecutor(max_workers=workers)
+
+    def visit(root, depth):
+        step = _list_dir(root, stat_files, prune)
+        if step is None:
+            return None, []
+        return step, [pool.submit(visit, d, depth + 1) for d in _subdirs(step[1], depth, max_depth)]
+
+    try:
+        stack = list(reversed([pool.submit(visit, d, 1) for d in subdirs]))
+        yield top
+        while stack:
+            step, children = stack.pop().result()
+            if step is None:
+                continue
+            yield step
+            stack.extend(reversed(children))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _walk_async(path, stat_files=False, prune=None, max_depth=None, concurrency=64):
+    """
+    Versi asyncio dari _walk: scandir tiap folder lewat asyncio.to_thread, maksimal
+    `concurrency` folder sekaligus. Return list (root, dirs, files) dengan urutan
+    sama seperti _walk.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def visit(root, depth):
+        async with sem:
+            step = await asyncio.to_thread(_list_dir, root, stat_files, prune)
+        if step is None:
+            return None, []
+        children = await asyncio.gather(
+            *(visit(d, depth + 1) for d in _subdirs(step[1], depth, max_depth))
+        )
+        return step, children
+
+    steps = []
+    stack = [await visit(path, 0)]
+    while stack:
+        step, children = stack.pop()
+        if step is None:
+            continue
+        steps.append(step)
+        stack.extend(reversed(children))
+    return steps
+
+
+# folder yang umumnya tidak perlu discan, untuk FolderUtilities.prune_common_dirs
+_COMMON_PRUNE_DIRS = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", "node_modules",
+    ".venv", ".tox", ".mypy_cache", ".pytest_cache",
+})
+
+
+def _ext_filter_key(extensions):
+    """
+    extensions -> (suffixes, bare) untuk _make_filter.
+
+    Ekstensi selalu di-anchor ke titik ("py" -> ".py"), jadi "happy"/"numpy"
+    tidak ikut cocok; ekstensi bertingkat seperti ".tar.gz" tetap cocok.
+    "" berarti file tanpa ekstensi (seperti Path.suffix == "").
+    """
+    if not extensions:
+        return None, False
+    suffixes = tuple(
+        e.lower() if e.startswith(".") else "." + e.lower() for e in extensions if e
+    )
+    return suffixes, "" in extensions
+
+
+@functools.lru_cache(maxsize=128)
+def _make_filter(suffixes, bare, kw):
+    """
+    Buat filter (name, is_file) -> bool yang sudah dispesialisasi untuk kombinasi
+    ekstensi/keyword, jadi cabang yang tidak dipakai tidak dicek per entry.
+
+    suffixes : tuple ekstensi lowercase (diawali "."), atau None
+    bare     : True -> file tanpa ekstensi juga lolos filter ekstensi
+    kw       : keyword lowercase, atau None
+    """
+    # nama yang sama persis dengan suffix (dotfile ".txt") dianggap tanpa ekstensi
+    if bare:
+        def has_ext(name_lower):
+            if name_lower.endswith(suffixes) and name_lower not in suffixes:
+                return True
+            i = name_lower.rfind(".")
+            return not 0 < i < len(name_lower) - 1
+    else:
+        def has_ext(name_lower):
+            return name_lower.endswith(suffixes) and name_lower not in suffixes
+
+    if (suffixes or bare) and kw:
+        def match_filter(name, is_file):
+            name_lower = name.lower()
+            return (not is_file or has_ext(name_lower)) and kw in name_lower
+    elif suffixes or bare:
+        def match_filter(name, is_file):
+            return not is_file or has_ext(name.lower())
+    elif kw:
+        def match_filter(name, is_file):
+            return kw in name.lower()
+    else:
+        def match_filter(name, is_file):
+            return True
+    return match_filter
+
+
+def _file_size(entry):
+    """st_size file (stat dari cache DirEntry), 0 jika file sudah hilang / gagal di-stat."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
+
+def _path_cut(root):
+    """
+    Panjang prefix "./" di DirEntry.path yang harus dibuang jika scan dimulai
+    dari ".", supaya hasil sama dengan str(Path(root) / name) seperti pathlib.
+    """
+    return len(os.curdir + os.sep) if root == os.curdir else 0
+
+
+def _walk_roots(steps, orig, norm):
+    """
+    Ganti key root hasil _walk(norm) dengan ejaan os.walk(orig), yaitu path asli
+    dari pemanggil (mis. "a//", "./a"); entry di dalamnya tidak diubah.
+    """
+    skip = len(norm) if norm.endswith(os.sep) else len(norm) + 1
+    for root, dirs, files in steps:
+        yield (orig if root == norm else os.path.join(orig, root[skip:])), dirs, files
+
+
+def _stat_record(entry, path):
+    """Dict info entry untuk scan_folder(with_stat=True), memakai stat yang di-cache DirEntry."""
+    try:
+        st = entry.stat()
+    except OSError:  # symlink rusak -> info dari link itu sendiri
+        st = entry.stat(follow_symlinks=False)
+    return {
+        "path": path,
+        "name": entry.name,
+        "is_dir": entry.is_dir(),
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        "ctime": st.st_ctime,
+    }
+
+
+def _scan(path, steps, fullpath, mode, extensions, keyword, sort_by, reverse, with_stat):
+    """
+    Filter, sort & format hasil scan_folder / scan_folder_async.
+
+    steps None -> isi satu level `path` (list sederhana), selain itu iterable
+    (root, dirs, files) dari _walk/_walk_async -> list of dict {root, dirs, files}.
+    `path` sudah dinormalisasi (str(Path(path))) oleh pemanggil.
+    """
+    cut = _path_cut(path)
+    match_filter = _make_filter(
+        *_ext_filter_key(extensions),
+        keyword.lower() if keyword else None,
+    )
+
+    def sort_items(items: list[os.DirEntry]):
+        if not sort_by:
+            return items
+        if sort_by == "name":
+            items.sort(key=lambda x: x.name.lower(), reverse=reverse)
+        elif sort_by in ("ctime", "mtime", "size"):
+            # stat sekali per entry (DirEntry.stat() di-cache, gratis di Windows)
+            attr = "st_" + sort_by
+            decorated = [(getattr(e.stat(), attr), e) for e in items]
+            decorated.sort(key=lambda t: t[0], reverse=reverse)
+            items = [t[1] for t in decorated]
+        return items
+
+    def emit(e: os.DirEntry):
+        if with_stat:
+            return _stat_record(e, e.path[cut:])
+        return e.path[cut:] if fullpath else e.name
+
+    # --- non recursive ---
+    if steps is None:
+        items = []
+        children = sort_items([c for c in _scan_dir(path) if match_filter(c.name, c.is_file())])
+        for child in children:
+            if mode == "files" and not child.is_file():
+                continue
+            if mode == "dirs" and not child.is_dir():
+                continue
+            items.append(emit(child))
+        return items
+
+    # --- recursive ---
+    result = []
+    for root, dirs, files in steps:
+        entry = {"root": root, "dirs": [], "files": []}
+
+        if mode in ("all", "dirs"):
+            dirs_filtered = [d for d in dirs if match_filter(d.name, False)]
+            dirs_sorted = sort_items(dirs_filtered)
+            entry["dirs"] = [emit(d) for d in dirs_sorted]
+
+        if mode in ("all", "files"):
+            files_filtered = [f for f in files if match_filter(f.name, f.is_file())]
+            files_sorted = sort_items(files_filtered)
+            entry["files"] = [emit(f) for f in files_sorted]
+
+        result.append(entry)
+    return result
+
+
+# errno dari copy_file_range yang berarti "tidak didukung di sini" -> fallback
+_COPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+def _fast_copy(src, dst):
+    """
+    copy_function untuk shutil.copytree (pengganti shutil.copy2).
+
+    Memakai os.copy_file_range (Linux 4.5+) supaya data disalin di kernel
+    (bisa reflink / server-side copy). Jika tidak tersedia atau gagal,
+    fallback ke shutil.copy2 yang di Linux sudah memakai os.sendfile.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    src_st = os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        dst_st = None
+    if not stat.S_ISREG(src_st.st_mode) or (
+        dst_st is not None and (os.path.samestat(src_st, dst_st) or not stat.S_ISREG(dst_st.st_mode))
+    ):
+        # file spesial, atau dst adalah file yang sama (copy ke diri sendiri / hard link):
+        # shutil.copy2 yang raise SameFileError/SpecialFileError tanpa menyentuh data
+        return shutil.copy2(src, dst)
+    try:
+        # dst baru dibuka (dan di-truncate) setelah src terbuka dan dicek
+        with open(src, "rb") as fsrc:
+            with open(dst, "wb") as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                blocksize = min(max(src_st.st_size, 2 ** 23), 2 ** 30)
+                copied = 0
+                while True:
+                    n = os.copy_file_range(src_fd, dst_fd, blocksize)
+                    if n == 0:
+                        break
+                    copied += n
+        if copied == 0:
+            # file kosong atau file virtual (mis. /proc) -> biar shutil yang tangani
+            return shutil.copy2(src, dst)
+    except OSError as e:
+        if e.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+# platform dihitung sekali saat import
+_SYSTEM = platform.system()
+
+
+@functools.lru_cache(maxsize=1)
+def _home():
+    """
+    Path.home() yang di-cache. Sengaja lazy: tanpa HOME / entry pwd, import
+    tetap jalan dan error hanya muncul di getter yang butuh home folder.
+    """
+    return Path.home()
+
+# cache kecil untuk is_folder_exist(use_cache=True): path -> (waktu cek, hasil)
+_EXISTS_TTL = 1.0
+_EXISTS_CACHE_SIZE = 1024
+_exists_cache: "OrderedDict[str, tuple[float, bool]]" = OrderedDict()
+_exists_lock = threading.Lock()
+
 
 class FolderUtilities:
     # =====================================================
@@ -10,80 +380,74 @@ class FolderUtilities:
     @staticmethod
     def get_user_folder():
         """Return user home folder."""
-        return str(Path.home())
+        return str(_home())
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_documents_folder():
         """Cross-platform Documents folder detection."""
-        home = Path.home()
-        system = platform.system()
-
-        if system == "Windows":
-            return str(home / "Documents")
-        elif system == "Darwin":  # macOS
-            return str(home / "Documents")
-        else:  # Linux and others
+        if _SYSTEM not in ("Windows", "Darwin"):  # Linux and others
             xdg_documents = os.environ.get("XDG_DOCUMENTS_DIR")
             if xdg_documents:
                 return os.path.expandvars(xdg_documents)
-            return str(home / "Documents")
+        return str(_home() / "Documents")
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_downloads_folder():
         """Cross-platform Downloads folder detection."""
-        home = Path.home()
-        system = platform.system()
-
-        if system == "Windows":
-            return str(home / "Downloads")
-        elif system == "Darwin":  # macOS
-            return str(home / "Downloads")
-        else:  # Linux and others
+        if _SYSTEM not in ("Windows", "Darwin"):  # Linux and others
             xdg_download = os.environ.get("XDG_DOWNLOAD_DIR")
             if xdg_download:
                 return os.path.expandvars(xdg_download)
-            return str(home / "Downloads")
+        return str(_home() / "Downloads")
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_desktop_folder():
         """Cross-platform Desktop folder detection."""
-        home = Path.home()
-        system = platform.system()
-
-        if system == "Windows":
-            return str(home / "Desktop")
-        elif system == "Darwin":  # macOS
-            return str(home / "Desktop")
-        else:  # Linux and others
+        if _SYSTEM not in ("Windows", "Darwin"):  # Linux and others
             xdg_desktop = os.environ.get("XDG_DESKTOP_DIR")
             if xdg_desktop:
                 return os.path.expandvars(xdg_desktop)
-            return str(home / "Desktop")
+        return str(_home() / "Desktop")
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_appdata_folder():
         """Windows AppData\Roaming or ~/.config for Linux/macOS."""
-        system = platform.system()
-
-        if system == "Windows":
-            return os.environ.get("APPDATA", str(Path.home() / "AppData" / "Roaming"))
-        else:
-            return str(Path.home() / ".config")
+        if _SYSTEM == "Windows":
+            return os.environ.get("APPDATA", str(_home() / "AppData" / "Roaming"))
+        return str(_home() / ".config")
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_local_appdata_folder():
         """Windows LocalAppData or ~/.local/share for Linux/macOS."""
-        system = platform.system()
+        if _SYSTEM == "Windows":
+            return os.environ.get("LOCALAPPDATA", str(_home() / "AppData" / "Local"))
+        return str(_home() / ".local" / "share")
 
-        if system == "Windows":
-            return os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local"))
-        else:
-            return str(Path.home() / ".local" / "share")
+    @staticmethod
+    def reset_folder_cache():
+        """
+        Hapus cache get_*_folder (hasilnya di-memoize), mis. setelah env
+        HOME / XDG_* / APPDATA berubah saat runtime.
+        """
+        _home.cache_clear()
+        for getter in (
+            FolderUtilities.get_documents_folder,
+            FolderUtilities.get_downloads_folder,
+            FolderUtilities.get_desktop_folder,
+            FolderUtilities.get_appdata_folder,
+            FolderUtilities.get_local_appdata_folder,
+        ):
+            getter.cache_clear()
 
     @staticmethod
     def get_temp_folder():
-        """Return temp folder (cross-platform)."""
-        return str(Path(os.getenv("TEMP") or Path(os.getenv("TMPDIR", "/tmp"))))
+        """Return temp folder (cross-platform, via tempfile yang hasilnya di-cache)."""
+        return tempfile.gettempdir()
         
 
 
@@ -94,29 +458,35 @@ class FolderUtilities:
     @staticmethod
     def create_folder(path: str, exist_ok: bool = True):
         """Create a folder (with parents)."""
-        Path(path).mkdir(parents=True, exist_ok=exist_ok)
-        return str(Path(path).resolve())
+        p = Path(path)
+        p.mkdir(parents=True, exist_ok=exist_ok)
+        FolderUtilities.clear_exists_cache()
+        return str(p.resolve())
 
     @staticmethod
     def delete_folder(path: str):
         """Delete folder and all contents."""
-        if Path(path).exists() and Path(path).is_dir():
+        if os.path.isdir(path):
             shutil.rmtree(path)
+            FolderUtilities.clear_exists_cache()
             return True
         return False
 
     @staticmethod
     def rename_folder(old_path: str, new_path: str):
         """Rename/move a folder."""
-        if Path(old_path).exists() and Path(old_path).is_dir():
-            Path(old_path).rename(new_path)
-            return str(Path(new_path).resolve())
+        old = Path(old_path)
+        if old.is_dir():
+            new = old.rename(new_path)
+            FolderUtilities.clear_exists_cache()
+            return str(new.resolve())
         return None
     
     @staticmethod
     def copy_folder(src, dst):
         if os.path.isdir(src):
-            shutil.copytree(src, dst, dirs_exist_ok=True)
+            shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_fast_copy)
+            FolderUtilities.clear_exists_cache()
             return True
         return False
 
@@ -124,6 +494,7 @@ class FolderUtilities:
     def move_folder(src, dst):
         if os.path.isdir(src):
             shutil.move(src, dst)
+            FolderUtilities.clear_exists_cache()
             return True
         return False
     
@@ -136,17 +507,17 @@ class FolderUtilities:
     def is_empty_folder(path: str):
         """Check if folder exists and is empty."""
         p = Path(path)
-        return p.exists() and p.is_dir() and not any(p.iterdir())
+        return p.is_dir() and not any(p.iterdir())
 
     @staticmethod
-    def get_folder_size(path: str):
-        """Get total folder size in bytes (recursive)."""
+    def get_folder_size(path: str, workers: int | None = None):
+        """Get total folder size in bytes (recursive). workers > 1 -> scan paralel."""
         total_size = 0
-        p = Path(path)
-        if p.exists() and p.is_dir():
-            for f in p.rglob("*"):
-                if f.is_file():
-                    total_size += f.stat().st_size
+        if os.path.isdir(path):
+            # stat dilakukan di dalam traversal (paralel jika workers > 1),
+            # lalu dijumlah per folder dengan sum() bawaan
+            for _, _, files in _walk(path, workers, stat_files=True):
+                total_size += sum(_file_size(f) for f in files if f.is_file())
         return total_size
 
     @staticmethod
@@ -156,12 +527,46 @@ class FolderUtilities:
 
     @staticmethod
     def join_path(*args):
-        """Join path parts safely."""
-        return str(Path(*args))
+        """
+        Join path parts safely (os.path.join, tanpa argumen -> ".").
+
+        Hasil tidak dinormalisasi seperti pathlib: join_path("a", "b/") -> "a/b/",
+        "a//b" tetap "a//b".
+        """
+        return os.path.join(*args) if args else os.curdir
 
     @staticmethod
-    def is_folder_exist(path):
-        return os.path.isdir(path)
+    def is_folder_exist(path, use_cache: bool = False):
+        """
+        Check if folder exists.
+
+        use_cache=True -> hasil disimpan maksimal _EXISTS_TTL detik (LRU 1024 path),
+        cocok untuk loop probing path yang sama berulang kali.
+        """
+        if not use_cache:
+            return os.path.isdir(path)
+
+        now = time.monotonic()
+        with _exists_lock:
+            cached = _exists_cache.get(path)
+            if cached is not None and now - cached[0] < _EXISTS_TTL:
+                _exists_cache.move_to_end(path)
+                return cached[1]
+
+        result = os.path.isdir(path)
+        with _exists_lock:
+            _exists_cache[path] = (now, result)
+            _exists_cache.move_to_end(path)
+            if len(_exists_cache) > _EXISTS_CACHE_SIZE:
+                _exists_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def clear_exists_cache():
+        """Kosongkan cache is_folder_exist(use_cache=True)."""
+        with _exists_lock:
+            _exists_cache.clear()
+
     # =====================================================
     # ============= SCAN DATA UTILITIES ===================
     # =====================================================
@@ -174,7 +579,11 @@ class FolderUtilities:
         extensions: list[str] | None = None,
         keyword: str | None = None,
         sort_by: str | None = "name",  # new parameter
-        reverse: bool = False           # ascending / descending
+        reverse: bool = False,          # ascending / descending
+        workers: int | None = None,
+        with_stat: bool = False,
+        prune_dirs: Callable[[str], bool] | None = None,
+        max_depth: int | None = None
     ):
         """
         Scan folder contents dengan filter ekstensi & keyword, plus sorting.
@@ -185,71 +594,78 @@ class FolderUtilities:
             fullpath (bool)  : True -> hasil berupa full path, False -> hanya nama
             mode (str)       : "all", "files", "dirs"
             extensions (list): filter berdasarkan ekstensi, ex: [".jpg", ".png"]
+                               ("jpg" = ".jpg", ".tar.gz" didukung, "" = tanpa ekstensi)
             keyword (str)    : filter nama file/folder mengandung string ini
             sort_by (str)    : None, "name", "ctime", "mtime", "size"
             reverse (bool)   : True -> descending, False -> ascending
+            workers (int)    : >1 -> scan rekursif paralel via thread pool
+            with_stat (bool) : True -> tiap item berupa dict
+                               {path, name, is_dir, size, mtime, ctime}
+            prune_dirs (func): prune_dirs(nama_folder) True -> subfolder dilewati
+                               (tidak discan), ex: FolderUtilities.prune_common_dirs
+            max_depth (int)  : batas kedalaman rekursif, 0 -> hanya folder target
 
         Return:
             - recursive=False -> list sederhana
             - recursive=True  -> list of dict {root, dirs, files}
         """
-        p = Path(path)
-        if not p.exists() or not p.is_dir():
+        # normalisasi sekali seperti pathlib ("a//" -> "a", "./a" -> "a")
+        orig = os.fspath(path)
+        path = str(Path(orig))
+        if not os.path.isdir(path):
             return []
 
-        def match_filter(entry: Path):
-            if extensions and entry.is_file():
-                if entry.suffix.lower() not in [e.lower() for e in extensions]:
-                    return False
-            if keyword and keyword.lower() not in entry.name.lower():
-                return False
-            return True
-
-        def sort_items(items: list[Path]):
-            if not sort_by:
-                return items
-            if sort_by == "name":
-                items.sort(key=lambda x: x.name.lower(), reverse=reverse)
-            elif sort_by == "ctime":
-                items.sort(key=lambda x: x.stat().st_ctime, reverse=reverse)
-            elif sort_by == "mtime":
-                items.sort(key=lambda x: x.stat().st_mtime, reverse=reverse)
-            elif sort_by == "size":
-                items.sort(key=lambda x: x.stat().st_size, reverse=reverse)
-            return items
-
-        # --- non recursive ---
-        if not recursive:
-            items = []
-            children = sort_items([c for c in p.iterdir() if match_filter(c)])
-            for child in children:
-                if mode == "files" and not child.is_file():
-                    continue
-                if mode == "dirs" and not child.is_dir():
-                    continue
-                items.append(str(child) if fullpath else child.name)
-            return items
-
-        # --- recursive ---
-        result = []
-        for root, dirs, files in os.walk(path):
-            entry = {"root": root, "dirs": [], "files": []}
+        steps = None
+        if recursive:
+            steps = _walk(path, workers, with_stat, prune_dirs, max_depth)
+            if orig != path:
+                steps = _walk_roots(steps, orig, path)
+        return _scan(path, steps, fullpath, mode, extensions, keyword, sort_by, reverse, with_stat)
 
-            dir_paths = [Path(root) / d for d in dirs]
-            file_paths = [Path(root) / f for f in files]
+    @staticmethod
+    def get_folder_listing_with_stat(path: str, recursive: bool = False, **kwargs):
+        """
+        Shortcut scan_folder(..., with_stat=True): path + info stat dari satu
+        DirEntry.stat(), jadi tidak perlu os.stat() lagi per hasil scan.
+        """
+        return FolderUtilities.scan_folder(path, recursive=recursive, with_stat=True, **kwargs)
 
-            if mode in ("all", "dirs"):
-                dirs_filtered = [d for d in dir_paths if match_filter(d)]
-                dirs_sorted = sort_items(dirs_filtered)
-                entry["dirs"] = [str(d) if fullpath else d.name for d in dirs_sorted]
 
-            if mode in ("all", "files"):
-                files_filtered = [f for f in file_paths if match_filter(f)]
-                files_sorted = sort_items(files_filtered)
-                entry["files"] = [str(f) if fullpath else f.name for f in files_sorted]
+    @staticmethod
+    async def scan_folder_async(
+        path: str,
+        recursive: bool = False,
+        fullpath: bool = True,
+        mode: str = "all",
+        extensions: list[str] | None = None,
+        keyword: str | None = None,
+        sort_by: str | None = "name",
+        reverse: bool = False,
+        with_stat: bool = False,
+        prune_dirs: Callable[[str], bool] | None = None,
+        max_depth: int | None = None,
+        concurrency: int = 64
+    ):
+        """
+        Versi async dari scan_folder (hasil sama persis), untuk network share / FUSE
+        dengan latency tinggi: scandir tiap folder dijalankan lewat asyncio.to_thread
+        sehingga banyak folder dibaca bersamaan.
 
-            result.append(entry)
-        return result
+        Params sama dengan scan_folder, plus:
+            concurrency (int): maksimal folder yang discan bersamaan
+        """
+        orig = os.fspath(path)
+        path = str(Path(orig))
+        if not await asyncio.to_thread(os.path.isdir, path):
+            return []
+        steps = None
+        if recursive:
+            steps = await _walk_async(path, with_stat, prune_dirs, max_depth, concurrency)
+            if orig != path:
+                steps = list(_walk_roots(steps, orig, path))
+        return await asyncio.to_thread(
+            _scan, path, steps, fullpath, mode, extensions, keyword, sort_by, reverse, with_stat
+        )
 
 
     @staticmethod
@@ -260,6 +676,8 @@ class FolderUtilities:
         mode: str = "all",
         extensions: list[str] | None = None,
         keyword: str | None = None,
+        prune_dirs: Callable[[str], bool] | None = None,
+        max_depth: int | None = None,
         ):
         """
         Iterate folder contents (generator version of scan_folder) dengan filter.
@@ -270,68 +688,103 @@ class FolderUtilities:
             fullpath (bool)  : True -> return full path, False -> only name
             mode (str)       : "all", "files", "dirs"
             extensions (list): filter ekstensi (misalnya [".jpg", ".png"])
+                               ("jpg" = ".jpg", ".tar.gz" didukung, "" = tanpa ekstensi)
             keyword (str)    : filter nama file/folder mengandung string
+            prune_dirs (func): prune_dirs(nama_folder) True -> subfolder dilewati
+            max_depth (int)  : batas kedalaman rekursif, 0 -> hanya folder target
 
         Yield:
             - recursive=False -> item by item (str)
             - recursive=True  -> dict {root, dirs, files} per step
         """
-        p = Path(path)
-        if not p.exists() or not p.is_dir():
+        # normalisasi sekali seperti pathlib; prefix "./" dibuang per entry
+        orig = os.fspath(path)
+        path = str(Path(orig))
+        if not os.path.isdir(path):
             return
 
-        def match_filter(entry: Path):
-            if extensions and entry.is_file():
-                if entry.suffix.lower() not in [e.lower() for e in extensions]:
-                    return False
-            if keyword and keyword.lower() not in entry.name.lower():
-                return False
-            return True
+        cut = _path_cut(path)
+        match_filter = _make_filter(
+            *_ext_filter_key(extensions),
+            keyword.lower() if keyword else None,
+        )
 
         # --- non recursive ---
         if not recursive:
-            for child in p.iterdir():
+            for child in _scan_dir(path):
                 if mode == "files" and not child.is_file():
                     continue
                 if mode == "dirs" and not child.is_dir():
                     continue
-                if not match_filter(child):
+                if not match_filter(child.name, child.is_file()):
                     continue
-                yield str(child) if fullpath else child.name
+                yield child.path[cut:] if fullpath else child.name
             return
 
         # --- recursive ---
-        for root, dirs, files in os.walk(path):
+        steps = _walk(path, prune=prune_dirs, max_depth=max_depth)
+        if orig != path:
+            steps = _walk_roots(steps, orig, path)
+        for root, dirs, files in steps:
             entry = {"root": root, "dirs": [], "files": []}
 
             if mode in ("all", "dirs"):
                 entry["dirs"] = [
-                    str(Path(root) / d) if fullpath else d
+                    d.path[cut:] if fullpath else d.name
                     for d in dirs
-                    if match_filter(Path(root) / d)
+                    if match_filter(d.name, False)
                 ]
             if mode in ("all", "files"):
                 entry["files"] = [
-                    str(Path(root) / f) if fullpath else f
+                    f.path[cut:] if fullpath else f.name
                     for f in files
-                    if match_filter(Path(root) / f)
+                    if match_filter(f.name, f.is_file())
                 ]
 
             yield entry
 
 
+    @staticmethod
+    def prune_common_dirs(name: str):
+        """Predicate prune_dirs bawaan: lewati .git, __pycache__, node_modules, dll."""
+        return name in _COMMON_PRUNE_DIRS
+
     @staticmethod
     def find_in_folder(path: str, pattern="*", recursive=True):
         p = Path(path)
-        if not p.exists() or not p.is_dir():
+        if not p.is_dir():
             return []
-        if recursive:
-            return [str(f) for f in p.rglob(pattern)]
-        else:
-            return [str(f) for f in p.glob(pattern)]
+
+        # pattern berisi path (mis. "sub/*.txt", "**") tetap lewat pathlib
+        if "**" in pattern or "/" in pattern or os.sep in pattern:
+            if recursive:
+                return [str(f) for f in p.rglob(pattern)]
+            else:
+                return [str(f) for f in p.glob(pattern)]
+
+        # pattern nama saja: compile sekali, cocokkan ke DirEntry.name
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        match = re.compile(fnmatch.translate(pattern), flags).match
+        # root dinormalisasi sekali (seperti pathlib), prefix "./" dibuang per entry
+        root = str(p)
+        cut = _path_cut(root)
+        result = []
+        stack = [root]
+        while stack:
+            subdirs = []
+            try:
+                for entry in _scan_dir(stack.pop()):
+                    if match(entry.name):
+                        result.append(entry.path[cut:])
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+            except PermissionError:
+                continue
+            stack.extend(reversed(subdirs))
+        return result
 
     @staticmethod
-    def count_items(path: str, recursive: bool = True):
+    def count_items(path: str, recursive: bool = True, workers: int | None = None):
         """
         Hitung jumlah file & folder dalam sebuah direktori.
 
@@ -339,20 +792,26 @@ class FolderUtilities:
             path (str)       : path target
             recursive (bool) : True -> hitung semua subfolder (rekursif)
                             False -> hanya level 1
+            workers (int)    : >1 -> scan rekursif paralel via thread pool
 
         Return:
             dict -> {"files": int, "dirs": int, "total": int}
         """
-        p = Path(path)
-        if not p.exists() or not p.is_dir():
+        if not os.path.isdir(path):
             return {"files": 0, "dirs": 0, "total": 0}
 
+        files = dirs = 0
         if recursive:
-            files = sum(1 for _ in p.rglob("*") if _.is_file())
-            dirs = sum(1 for _ in p.rglob("*") if _.is_dir())
+            # satu kali traversal, tipe entry diambil dari DirEntry
+            for _, sub_dirs, sub_files in _walk(path, workers):
+                dirs += len(sub_dirs)
+                files += sum(1 for f in sub_files if f.is_file())
         else:
-            files = sum(1 for _ in p.iterdir() if _.is_file())
-            dirs = sum(1 for _ in p.iterdir() if _.is_dir())
+            for entry in _scan_dir(path):
+                if entry.is_dir():
+                    dirs += 1
+                elif entry.is_file():
+                    files += 1
 
         return {"files": files, "dirs": dirs, "total": files + dirs}
 
@@ -361,24 +820,39 @@ class FolderUtilities:
     # =====================================================
     @staticmethod
     def get_parent_folder(path: str):
-        """Return parent folder of given path."""
-        return str(Path(path).parent.resolve())
+        """
+        Return parent folder of given path (absolute, symlink tidak di-resolve).
+
+        Path di-absolute-kan dulu, jadi "." -> parent dari cwd dan ".." -> parent
+        dari parent cwd (bukan cwd seperti Path(".").parent).
+        """
+        return os.path.dirname(os.path.abspath(path))
 
     @staticmethod
     def get_cwd():
         """Get current working directory."""
-        return str(Path.cwd())
+        return os.getcwd()
 
     @staticmethod
     def change_cwd(path: str):
         """Change current working directory."""
         os.chdir(path)
-        return str(Path.cwd())
+        return os.getcwd()
 
     @staticmethod
     def get_absolute_path(path: str):
-        """Return absolute normalized path."""
-        return str(Path(path).resolve())
+        """
+        Return absolute normalized path.
+
+        Seperti os.path.abspath: symlink tidak di-resolve, gunakan get_real_path
+        jika perlu path asli.
+        """
+        return os.path.abspath(path)
+
+    @staticmethod
+    def get_real_path(path: str):
+        """Return absolute path dengan semua symlink di-resolve (os.path.realpath)."""
+        return os.path.realpath(path)
 
 
 